@@ -0,0 +1,314 @@
+#!/usr/bin/env -S uv run --script
+# settings.json prefers the pre-built .claude/hooks/.venv (see README) and
+# falls back to uv run with the dependencies below when it is missing.
+# /// script
+# requires-python = ">=3.8"
+# dependencies = [
+#     "orjson",
+#     "ruff",
+# ]
+# ///
+
+import functools
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from datetime import datetime
+import shutil
+
+# Tools installed next to the interpreter (e.g. ruff in the hooks venv) take precedence
+os.environ['PATH'] = os.path.dirname(sys.executable) + os.pathsep + os.environ.get('PATH', '')
+
+# Hook events that may have written files worth formatting and linting
+RELEVANT_TOOLS = frozenset({'Write', 'Edit', 'MultiEdit'})
+
+# File type for each supported extension
+EXTENSION_TYPES = {
+    '.py': 'python',
+    '.go': 'go',
+    '.rs': 'rust',
+    '.js': 'javascript',
+    '.jsx': 'javascript',
+    '.mjs': 'javascript',
+    '.ts': 'typescript',
+    '.tsx': 'typescript',
+    '.json': 'json',
+}
+
+# Tools whose versions determine the formatted output for each file type
+FORMATTER_TOOLS = {
+    'python': ('ruff',),
+    'go': ('gofmt',),
+    'rust': ('rustfmt',),
+    'javascript': ('prettier', 'deno'),
+    'typescript': ('prettier', 'deno'),
+    'json': ('prettier',),
+}
+
+@functools.lru_cache(maxsize=None)
+def check_tool_installed(tool_name):
+    """Check if a formatting tool is installed; PATH is only searched once per tool."""
+    return shutil.which(tool_name) is not None
+
+def format_diagnostics(diagnostics):
+    """Render ruff JSON diagnostics as one 'file:row:col: CODE message' line each."""
+    lines = []
+    for d in diagnostics:
+        location = d.get('location') or {}
+        lines.append(f"{d['filename']}:{location.get('row')}:{location.get('column')}: {d.get('code')} {d.get('message')}")
+    return ''.join(line + '\n' for line in lines)
+
+def lint_files(file_paths):
+    """
+    Run one 'ruff check --fix' over a batch of Python files.
+    
+    Import sorting (rule I) is enabled on top of the project's rule selection,
+    so the fixes it applies before formatting include sorted imports.
+    Returns the completed process and the remaining diagnostics grouped by
+    resolved file path.
+    """
+    from utils.fast_json import loads
+    
+    lint_result = subprocess.run(
+        ['ruff', 'check', '--fix', '--extend-select', 'I', '--output-format=json', *file_paths],
+        capture_output=True,
+        text=True
+    )
+    
+    # Group remaining diagnostics by file
+    diagnostics = {}
+    for diagnostic in loads(lint_result.stdout or '[]'):
+        diagnostics.setdefault(os.path.realpath(diagnostic['filename']), []).append(diagnostic)
+    
+    return lint_result, diagnostics
+
+def format_files(file_paths, file_type):
+    """Format a batch of files of the same type with one invocation per tool."""
+    results = []
+    
+    if file_type == "python":
+        # Imports are already sorted by lint_files, so only formatting is left
+        if check_tool_installed("ruff"):
+            try:
+                subprocess.run(['ruff', 'format', *file_paths], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+                results.append({"tool": "ruff-format", "status": "success"})
+            except subprocess.CalledProcessError as e:
+                results.append({"tool": "ruff-format", "status": "failed", "error": e.stderr})
+        else:
+            results.append({"tool": "ruff", "status": "not_installed"})
+    
+    elif file_type == "go":
+        # Run gofmt
+        if check_tool_installed("gofmt"):
+            try:
+                subprocess.run(['gofmt', '-w', *file_paths], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+                results.append({"tool": "gofmt", "status": "success"})
+            except subprocess.CalledProcessError as e:
+                results.append({"tool": "gofmt", "status": "failed", "error": e.stderr})
+        else:
+            results.append({"tool": "gofmt", "status": "not_installed"})
+    
+    elif file_type == "rust":
+        # Run rustfmt
+        if check_tool_installed("rustfmt"):
+            try:
+                subprocess.run(['rustfmt', '--edition', '2021', *file_paths], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+                results.append({"tool": "rustfmt", "status": "success"})
+            except subprocess.CalledProcessError as e:
+                results.append({"tool": "rustfmt", "status": "failed", "error": e.stderr})
+        else:
+            results.append({"tool": "rustfmt", "status": "not_installed"})
+    
+    elif file_type in ["javascript", "typescript", "json"]:
+        # Try prettier first
+        if check_tool_installed("prettier"):
+            try:
+                subprocess.run(['prettier', '--write', *file_paths], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+                results.append({"tool": "prettier", "status": "success"})
+            except subprocess.CalledProcessError as e:
+                results.append({"tool": "prettier", "status": "failed", "error": e.stderr})
+        # If prettier not available and it's JavaScript/TypeScript, try deno fmt
+        elif file_type != "json" and check_tool_installed("deno"):
+            try:
+                subprocess.run(['deno', 'fmt', *file_paths], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+                results.append({"tool": "deno", "status": "success"})
+            except subprocess.CalledProcessError as e:
+                results.append({"tool": "deno", "status": "failed", "error": e.stderr})
+        else:
+            results.append({"tool": "prettier/deno", "status": "not_installed"})
+    
+    return results
+
+def get_file_type(file_path):
+    """Determine the file type based on extension."""
+    return EXTENSION_TYPES.get(os.path.splitext(file_path)[1].lower())
+
+def main():
+    try:
+        # Read stdin as raw bytes and decode it in one call; the payload is small,
+        # so the stdlib decoder is cheaper here than importing orjson on no-op runs
+        raw = sys.stdin.buffer.read()
+        input_data = json.loads(raw) if raw else {}
+        
+        # Check if this is a relevant tool
+        tool_name = input_data.get('tool_name', '')
+        if tool_name not in RELEVANT_TOOLS:
+            sys.exit(0)
+        
+        # Extract file path; every relevant tool names exactly one file
+        tool_input = input_data.get('tool_input', {})
+        file_paths = []
+        
+        file_path = tool_input.get('file_path')
+        if file_path:
+            file_paths.append(file_path)
+        
+        # Filter for supported file types
+        files_to_format = []
+        for fp in file_paths:
+            file_type = get_file_type(fp)
+            if file_type and os.path.exists(fp):
+                files_to_format.append((fp, file_type))
+        
+        if not files_to_format:
+            sys.exit(0)
+        
+        # Imported only once there are files to process, keeping no-op runs cheap
+        from utils.file_cache import is_unchanged, load_cache, record, save_cache, tool_fingerprint
+        from utils.jsonl_log import append_log
+        
+        # Skip files that are unchanged since they were last formatted and linted;
+        # nothing is created on disk until there is actual work to record
+        log_dir = Path.cwd() / 'logs'
+        cache_path = log_dir / '.format_and_lint_cache.json'
+        cache = load_cache(cache_path)
+        tool_versions = {
+            file_type: tool_fingerprint(*FORMATTER_TOOLS[file_type])
+            for file_type in {file_type for _, file_type in files_to_format}
+        }
+        files_to_format = [
+            (fp, file_type) for fp, file_type in files_to_format
+            if not is_unchanged(cache, fp, tool_versions[file_type])
+        ]
+        
+        if not files_to_format:
+            sys.exit(0)
+        
+        # Largest files first so the longest batches start earliest; payloads
+        # currently name a single file, in which case there is nothing to order
+        if len(files_to_format) > 1:
+            files_to_format.sort(key=lambda t: -os.path.getsize(t[0]))
+        
+        # Ensure log directory exists
+        log_dir.mkdir(parents=True, exist_ok=True)
+        log_path = log_dir / 'format_and_lint.jsonl'
+        
+        # One timestamp and session id shared by every record of this run
+        now_iso = datetime.now().isoformat()
+        session_id = input_data.get('session_id', 'unknown')
+        
+        # Group files by type so each tool runs once per batch
+        files_by_type = {}
+        for file_path, file_type in files_to_format:
+            files_by_type.setdefault(file_type, []).append(file_path)
+        
+        # Lint Python files before formatting them: fixes such as import sorting
+        # can leave code that ruff format would still change, never the reverse
+        python_files = files_by_type.get('python', [])
+        lint_results = []
+        lint_clean = set()
+        if python_files:
+            try:
+                lint_result, diagnostics = lint_files(python_files)
+                for file_path in python_files:
+                    file_diagnostics = diagnostics.get(os.path.realpath(file_path), [])
+                    lint_results.append({
+                        'file': file_path,
+                        'timestamp': now_iso,
+                        'fixed': not file_diagnostics,
+                        'has_issues': len(file_diagnostics) > 0,
+                        'output': format_diagnostics(file_diagnostics) + lint_result.stderr,
+                        'tool_name': tool_name,
+                        'session_id': session_id
+                    })
+                    if not file_diagnostics and lint_result.returncode in (0, 1):
+                        lint_clean.add(file_path)
+            except Exception as e:
+                for file_path in python_files:
+                    lint_results.append({
+                        'file': file_path,
+                        'timestamp': now_iso,
+                        'error': str(e),
+                        'tool_name': tool_name,
+                        'session_id': session_id
+                    })
+        
+        # Every Write/Edit/MultiEdit payload names one file, so there is usually a
+        # single batch; run it inline and only use a pool when there are several
+        if len(files_by_type) == 1:
+            batches = [
+                (file_type, paths, format_files(paths, file_type))
+                for file_type, paths in files_by_type.items()
+            ]
+        else:
+            # Format each batch concurrently; the tools are independent processes
+            from concurrent.futures import ThreadPoolExecutor, as_completed
+            
+            batches = []
+            max_workers = min(len(files_by_type), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(format_files, paths, file_type): (file_type, paths)
+                    for file_type, paths in files_by_type.items()
+                }
+                for future in as_completed(futures):
+                    file_type, paths = futures[future]
+                    batches.append((file_type, paths, future.result()))
+        
+        all_results = []
+        cache_updates = {}
+        for file_type, paths, format_results in batches:
+            # Remember the final contents so the next run can skip them; Python
+            # files with lint issues are left out so they are re-reported
+            if all(r['status'] == 'success' for r in format_results):
+                for file_path in paths:
+                    if file_type != 'python' or file_path in lint_clean:
+                        record(cache_updates, file_path, tool_versions[file_type])
+            
+            for file_path in paths:
+                result = {
+                    'file': file_path,
+                    'file_type': file_type,
+                    'timestamp': now_iso,
+                    'results': format_results,
+                    'tool_name': tool_name,
+                    'session_id': session_id
+                }
+                
+                all_results.append(result)
+        
+        # Log results
+        if all_results or lint_results:
+            log_entry = {
+                'timestamp': now_iso,
+                'formatted_files': all_results,
+                'lint_results': lint_results
+            }
+            append_log(log_path, log_entry)
+        
+        # Saved after logging so a cache write failure can never drop the record
+        save_cache(cache_path, cache_updates)
+        
+        sys.exit(0)
+        
+    except json.JSONDecodeError:
+        # Handle JSON decode errors gracefully
+        sys.exit(0)
+    except Exception:
+        # Exit cleanly on any other error
+        sys.exit(0)
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,52 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.8"
+# dependencies = [
+#     "orjson",
+# ]
+# ///
+
+"""
+JSON encode/decode backed by orjson, falling back to the standard library.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # orjson is optional
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Decode a JSON document.
+
+    Args:
+        data: Raw JSON as bytes or str
+
+    Returns:
+        The decoded Python object
+
+    Raises:
+        json.JSONDecodeError: If the input is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Encode an object as compact UTF-8 JSON.
+
+    Args:
+        obj: Object to encode
+
+    Returns:
+        The encoded JSON without insignificant whitespace
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
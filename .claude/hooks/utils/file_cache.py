@@ -0,0 +1,150 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.8"
+# ///
+
+"""
+Content-hash cache that lets hooks skip files they have already processed.
+
+Entries are keyed on file contents plus the path and mtime of the tool
+executables. Tool configuration (pyproject.toml, ruff.toml, .prettierrc, ...)
+is not part of the key, so after changing it, delete the cache file to force
+every file to be processed again.
+"""
+
+import functools
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+
+from .fast_json import dumps, loads
+
+# Upper bound on cached files; the oldest entries are dropped first
+MAX_CACHE_ENTRIES = 500
+
+# PATH does not change during a hook run, so each lookup is done only once
+_which = functools.lru_cache(maxsize=None)(shutil.which)
+
+
+def file_digest(file_path: str) -> str:
+    """
+    Compute the SHA-1 digest of a file's contents.
+
+    Args:
+        file_path: Path of the file to hash
+
+    Returns:
+        Hex digest of the file contents
+    """
+    with open(file_path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def tool_fingerprint(*tool_names: str) -> Dict[str, Optional[str]]:
+    """
+    Identify the installed version of each tool without spawning it.
+
+    The resolved executable path plus its mtime changes whenever the tool is
+    upgraded or replaced, which is enough to invalidate cached results.
+
+    Args:
+        tool_names: Executable names to fingerprint
+
+    Returns:
+        Mapping of tool name to fingerprint, or None if not installed
+    """
+    fingerprint = {}
+    for name in tool_names:
+        path = _which(name)
+        fingerprint[name] = f"{path}:{os.stat(path).st_mtime_ns}" if path else None
+    return fingerprint
+
+
+def load_cache(cache_path: Path) -> dict:
+    """
+    Load the cache table, treating a missing or corrupt file as empty.
+
+    Args:
+        cache_path: Location of the cache file
+
+    Returns:
+        Mapping of absolute file path to its cache entry
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            cache = loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_cache(cache_path: Path, updates: dict) -> None:
+    """
+    Merge new entries into the cache file, keeping only the most recent ones.
+
+    The table is re-read just before writing so entries saved by hook runs
+    executing concurrently are kept. Failures are swallowed: a missing cache
+    update only costs a redundant run next time.
+
+    Args:
+        cache_path: Location of the cache file
+        updates: Entries recorded during this run
+    """
+    if not updates:
+        return
+    cache = load_cache(cache_path)
+    for key, entry in updates.items():
+        # Re-insert so the entry counts as most recent when trimming
+        cache.pop(key, None)
+        cache[key] = entry
+    if len(cache) > MAX_CACHE_ENTRIES:
+        cache = dict(list(cache.items())[-MAX_CACHE_ENTRIES:])
+
+    # A per-process temp file keeps concurrent runs from clobbering each other
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(dumps(cache))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def is_unchanged(cache: dict, file_path: str, tool_versions: dict) -> bool:
+    """
+    Check whether a file was already processed in its current state.
+
+    Args:
+        cache: Mapping of absolute file path to its cache entry
+        file_path: Path of the file to check
+        tool_versions: Fingerprint of the tools that would process the file
+
+    Returns:
+        True if the file's contents and tool versions match the cache
+    """
+    entry = cache.get(os.path.abspath(file_path))
+    return (
+        entry is not None
+        and entry.get("tool_versions") == tool_versions
+        and entry.get("sha1") == file_digest(file_path)
+    )
+
+
+def record(updates: dict, file_path: str, tool_versions: dict) -> None:
+    """
+    Remember a file's current contents as successfully processed.
+
+    Args:
+        updates: Entries recorded during this run, later passed to save_cache
+        file_path: Path of the file that was processed
+        tool_versions: Fingerprint of the tools that processed the file
+    """
+    updates[os.path.abspath(file_path)] = {"sha1": file_digest(file_path), "tool_versions": tool_versions}
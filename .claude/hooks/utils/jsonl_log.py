@@ -0,0 +1,39 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.8"
+# ///
+
+"""
+Append-only JSON Lines logging for hooks.
+"""
+
+import os
+from pathlib import Path
+
+from .fast_json import dumps
+
+# Size at which a log is rotated to <name>.1 and started afresh
+MAX_LOG_BYTES = 1024 * 1024
+
+
+def append_log(log_path: Path, entry: dict) -> None:
+    """
+    Append one JSON record to a JSONL log with a single write syscall.
+
+    Args:
+        log_path: Location of the JSONL log
+        entry: Record to append
+    """
+    # Rotate instead of trimming so each run only appends one line
+    try:
+        if os.stat(log_path).st_size > MAX_LOG_BYTES:
+            os.replace(log_path, f"{log_path}.1")
+    except FileNotFoundError:
+        pass
+
+    payload = dumps(entry) + b"\n"
+    fd = os.open(log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)